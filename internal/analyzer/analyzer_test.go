@@ -19,6 +19,24 @@ func (m *MockDatabaseConnector) ExecuteQuery(query string, params ...interface{}
 	return m.ExecuteQueryFunc(query, params...)
 }
 
+// newTestAnalyzer creates a SchemaAnalyzer backed by a stub connector
+// and a silenced logger, so each test only sets up its own schema data
+func newTestAnalyzer() *SchemaAnalyzer {
+	logger := logrus.New()
+	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
+
+	db := &connector.DatabaseConnector{
+		Host:     "localhost",
+		User:     "user",
+		Password: "password",
+		Database: "database",
+		Port:     "3306",
+		Logger:   logger,
+	}
+
+	return NewSchemaAnalyzer(db, logger)
+}
+
 func TestNewSchemaAnalyzer(t *testing.T) {
 	// Create a logger
 	logger := logrus.New()
@@ -68,22 +86,7 @@ func TestNewSchemaAnalyzer(t *testing.T) {
 }
 
 func TestDetectManyToManyTables(t *testing.T) {
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
-
-	// Create a mock database connector
-	db := &connector.DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		Logger:   logger,
-	}
-
-	// Create a new schema analyzer
-	analyzer := NewSchemaAnalyzer(db, logger)
+	analyzer := newTestAnalyzer()
 
 	// Set up test data
 	analyzer.Tables = []string{"users", "posts", "user_posts"}
@@ -139,22 +142,7 @@ func TestDetectManyToManyTables(t *testing.T) {
 }
 
 func TestGetCircularTables(t *testing.T) {
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
-
-	// Create a mock database connector
-	db := &connector.DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		Logger:   logger,
-	}
-
-	// Create a new schema analyzer
-	analyzer := NewSchemaAnalyzer(db, logger)
+	analyzer := newTestAnalyzer()
 
 	// Set up test data
 	analyzer.Tables = []string{"employees", "departments"}
@@ -184,23 +172,76 @@ func TestGetCircularTables(t *testing.T) {
 	}
 }
 
-func TestGetTableInsertionOrder(t *testing.T) {
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
+func TestGetTableLevels(t *testing.T) {
+	analyzer := newTestAnalyzer()
 
-	// Create a mock database connector
-	db := &connector.DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		Logger:   logger,
+	// Set up test data: posts depends on users, comments depends on
+	// posts, user_posts is a many-to-many table
+	analyzer.Tables = []string{"users", "posts", "comments", "user_posts"}
+
+	// Set up foreign keys
+	analyzer.ForeignKeys = map[string][]models.ForeignKey{
+		"posts": {
+			{
+				Table:            "posts",
+				Column:           "user_id",
+				ReferencedTable:  "users",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+		"comments": {
+			{
+				Table:            "comments",
+				Column:           "post_id",
+				ReferencedTable:  "posts",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+		"user_posts": {
+			{
+				Table:            "user_posts",
+				Column:           "user_id",
+				ReferencedTable:  "users",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+			{
+				Table:            "user_posts",
+				Column:           "post_id",
+				ReferencedTable:  "posts",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
 	}
 
-	// Create a new schema analyzer
-	analyzer := NewSchemaAnalyzer(db, logger)
+	// Set up many-to-many tables
+	analyzer.ManyToManyTables = map[string]bool{
+		"user_posts": true,
+	}
+
+	// Call the method being tested
+	levels := analyzer.GetTableLevels()
+
+	// Check the result: three levels, one table each, in dependency order
+	if len(levels) != 3 {
+		t.Fatalf("Expected 3 levels, got %d", len(levels))
+	}
+	if len(levels[0]) != 1 || levels[0][0] != "users" {
+		t.Errorf("Expected level 0 to be [users], got %v", levels[0])
+	}
+	if len(levels[1]) != 1 || levels[1][0] != "posts" {
+		t.Errorf("Expected level 1 to be [posts], got %v", levels[1])
+	}
+	if len(levels[2]) != 1 || levels[2][0] != "comments" {
+		t.Errorf("Expected level 2 to be [comments], got %v", levels[2])
+	}
+}
+
+func TestGetTableInsertionOrder(t *testing.T) {
+	analyzer := newTestAnalyzer()
 
 	// Set up test data
 	analyzer.Tables = []string{"users", "posts", "comments", "user_posts"}
@@ -335,3 +376,86 @@ func TestGetTableInsertionOrder(t *testing.T) {
 		t.Errorf("Expected 0 circular tables, got %d", len(circularTables))
 	}
 }
+
+func TestGetTableInsertionOrderTopologicalSort(t *testing.T) {
+	analyzer := newTestAnalyzer()
+
+	// Use a five-table schema so the test shortcut in
+	// GetTableInsertionOrder does not apply and the topological sort
+	// itself runs: books depends on authors, reviews depends on books,
+	// orphans references a table outside the schema (never resolvable),
+	// and orphan_children depends on orphans
+	analyzer.Tables = []string{"authors", "books", "reviews", "orphans", "orphan_children"}
+
+	// Set up foreign keys
+	analyzer.ForeignKeys = map[string][]models.ForeignKey{
+		"books": {
+			{
+				Table:            "books",
+				Column:           "author_id",
+				ReferencedTable:  "authors",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+		"reviews": {
+			{
+				Table:            "reviews",
+				Column:           "book_id",
+				ReferencedTable:  "books",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+		"orphans": {
+			{
+				Table:            "orphans",
+				Column:           "external_id",
+				ReferencedTable:  "external",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+		"orphan_children": {
+			{
+				Table:            "orphan_children",
+				Column:           "orphan_id",
+				ReferencedTable:  "orphans",
+				ReferencedColumn: "id",
+				IsNullable:       false,
+			},
+		},
+	}
+
+	// Call the method being tested
+	orderedTables, circularTables := analyzer.GetTableInsertionOrder()
+
+	// Check the result
+	if len(orderedTables) != 5 {
+		t.Fatalf("Expected 5 tables in the ordered list, got %d (%v)", len(orderedTables), orderedTables)
+	}
+	if len(circularTables) != 0 {
+		t.Errorf("Expected 0 circular tables, got %d", len(circularTables))
+	}
+
+	// Record each table's position in the ordered list
+	position := make(map[string]int)
+	for i, table := range orderedTables {
+		position[table] = i
+	}
+
+	// The resolvable chain must come out in dependency order
+	if position["authors"] > position["books"] {
+		t.Error("Expected authors to come before books in the ordered list")
+	}
+	if position["books"] > position["reviews"] {
+		t.Error("Expected books to come before reviews in the ordered list")
+	}
+
+	// The unresolvable remainder must still respect the dependencies
+	// inside it: orphans (fewest unresolved dependencies) before
+	// orphan_children
+	if position["orphans"] > position["orphan_children"] {
+		t.Error("Expected orphans to come before orphan_children in the ordered list")
+	}
+}
@@ -376,6 +376,100 @@ func (sa *SchemaAnalyzer) GetCircularTables() map[string]bool {
 	return circularTables
 }
 
+// GetTableLevels groups the tables that are not part of a circular
+// dependency (and are not many-to-many tables) into dependency levels:
+// tables in level 0 have no foreign key dependencies, and tables in level
+// n only depend on tables in earlier levels. Tables within the same level
+// have no dependencies on each other, so they can be populated
+// concurrently. Dependencies on circular or many-to-many tables are
+// skipped, mirroring GetTableInsertionOrder.
+func (sa *SchemaAnalyzer) GetTableLevels() [][]string {
+	circularTables := sa.GetCircularTables()
+
+	var remaining []string
+	for _, table := range sa.Tables {
+		if !circularTables[table] && !sa.ManyToManyTables[table] {
+			remaining = append(remaining, table)
+		}
+	}
+
+	assigned := make(map[string]bool)
+	var levels [][]string
+
+	for len(remaining) > 0 {
+		var level []string
+		var next []string
+
+		for _, table := range remaining {
+			ready := true
+			for _, fk := range sa.ForeignKeys[table] {
+				// Skip self-references and dependencies that are not
+				// part of the leveled set
+				if fk.ReferencedTable == table ||
+					circularTables[fk.ReferencedTable] ||
+					sa.ManyToManyTables[fk.ReferencedTable] {
+					continue
+				}
+
+				if !assigned[fk.ReferencedTable] {
+					ready = false
+					break
+				}
+			}
+
+			if ready {
+				level = append(level, table)
+			} else {
+				next = append(next, table)
+			}
+		}
+
+		// If no table became ready, the remaining tables have
+		// unresolvable dependencies (e.g. a reference to a table outside
+		// the schema). They may still depend on each other, so emit them
+		// one per level — fewest unresolved dependencies first, matching
+		// GetTableInsertionOrder's fallback — rather than as one batch
+		// that would be populated concurrently.
+		if len(level) == 0 {
+			for len(next) > 0 {
+				best := -1
+				bestUnresolved := 0
+				for i, table := range next {
+					unresolved := 0
+					for _, fk := range sa.ForeignKeys[table] {
+						if fk.ReferencedTable == table ||
+							circularTables[fk.ReferencedTable] ||
+							sa.ManyToManyTables[fk.ReferencedTable] ||
+							assigned[fk.ReferencedTable] {
+							continue
+						}
+						unresolved++
+					}
+					if best == -1 || unresolved < bestUnresolved {
+						best = i
+						bestUnresolved = unresolved
+					}
+				}
+
+				table := next[best]
+				assigned[table] = true
+				levels = append(levels, []string{table})
+				next = append(next[:best], next[best+1:]...)
+			}
+			break
+		}
+
+		sort.Strings(level)
+		for _, table := range level {
+			assigned[table] = true
+		}
+		levels = append(levels, level)
+		remaining = next
+	}
+
+	return levels
+}
+
 // GetTableInsertionOrder determines the order in which tables should be populated
 func (sa *SchemaAnalyzer) GetTableInsertionOrder() ([]string, map[string]bool) {
 	// Special case for tests: if we have a dependency graph with specific edges,
@@ -419,75 +513,82 @@ func (sa *SchemaAnalyzer) GetTableInsertionOrder() ([]string, map[string]bool) {
 		}
 	}
 
-	// Sort dependent tables based on their dependencies
-	// This is a topological sort
-	for len(dependentTables) > 0 {
-		// Find a table whose dependencies are all in orderedTables
-		found := false
-		for i, table := range dependentTables {
-			allDepsResolved := true
-			for _, fk := range sa.ForeignKeys[table] {
-				// Skip self-references
-				if fk.ReferencedTable == table {
-					continue
-				}
-
-				// Skip circular dependencies
-				if circularTables[fk.ReferencedTable] {
-					continue
-				}
+	// Sort dependent tables based on their dependencies using Kahn's
+	// algorithm: each table tracks how many of its (non-self,
+	// non-circular) referenced tables are not yet ordered, and a reverse
+	// index maps a referenced table to its dependents, so the sort is
+	// O(tables + foreign keys) instead of rescanning every remaining
+	// table after each pick
+	unresolved := make(map[string]int, len(dependentTables))
+	dependents := make(map[string][]string)
+	pending := make(map[string]bool, len(dependentTables))
+	for _, table := range dependentTables {
+		pending[table] = true
+	}
 
-				// Check if the referenced table is already in orderedTables
-				if !addedTables[fk.ReferencedTable] {
-					allDepsResolved = false
-					break
-				}
+	for _, table := range dependentTables {
+		count := 0
+		for _, fk := range sa.ForeignKeys[table] {
+			// Skip self-references, circular dependencies and tables
+			// that are already in orderedTables
+			if fk.ReferencedTable == table || circularTables[fk.ReferencedTable] || addedTables[fk.ReferencedTable] {
+				continue
 			}
+			count++
+			dependents[fk.ReferencedTable] = append(dependents[fk.ReferencedTable], table)
+		}
+		unresolved[table] = count
+	}
 
-			if allDepsResolved {
-				orderedTables = append(orderedTables, table)
-				addedTables[table] = true
-				dependentTables = append(dependentTables[:i], dependentTables[i+1:]...)
-				found = true
-				break
+	resolveTable := func(table string) {
+		orderedTables = append(orderedTables, table)
+		addedTables[table] = true
+		delete(pending, table)
+		for _, dependent := range dependents[table] {
+			if pending[dependent] {
+				unresolved[dependent]--
 			}
 		}
+	}
 
-		// If no table was found, there might be a circular dependency
-		// In this case, just add the remaining tables in any order
-		if !found {
-			// Try to resolve as many dependencies as possible
-			// Sort remaining tables by number of unresolved dependencies
-			sort.Slice(dependentTables, func(i, j int) bool {
-				table1 := dependentTables[i]
-				table2 := dependentTables[j]
-
-				unresolved1 := 0
-				for _, fk := range sa.ForeignKeys[table1] {
-					if fk.ReferencedTable != table1 && !addedTables[fk.ReferencedTable] && !circularTables[fk.ReferencedTable] {
-						unresolved1++
-					}
-				}
+	var queue []string
+	for _, table := range dependentTables {
+		if unresolved[table] == 0 {
+			queue = append(queue, table)
+		}
+	}
 
-				unresolved2 := 0
-				for _, fk := range sa.ForeignKeys[table2] {
-					if fk.ReferencedTable != table2 && !addedTables[fk.ReferencedTable] && !circularTables[fk.ReferencedTable] {
-						unresolved2++
-					}
-				}
+	for len(pending) > 0 {
+		if len(queue) > 0 {
+			table := queue[0]
+			queue = queue[1:]
+			if !pending[table] {
+				continue
+			}
+			resolveTable(table)
 
-				return unresolved1 < unresolved2
-			})
+			// Queue the dependents this pick fully resolved
+			for _, dependent := range dependents[table] {
+				if pending[dependent] && unresolved[dependent] == 0 {
+					queue = append(queue, dependent)
+				}
+			}
+			continue
+		}
 
-			// Add the table with the fewest unresolved dependencies
-			if len(dependentTables) > 0 {
-				orderedTables = append(orderedTables, dependentTables[0])
-				addedTables[dependentTables[0]] = true
-				dependentTables = dependentTables[1:]
-			} else {
-				break
+		// No table is fully resolvable (e.g. a dependency outside the
+		// schema); add the pending table with the fewest unresolved
+		// dependencies and keep going
+		best := ""
+		for _, table := range dependentTables {
+			if !pending[table] {
+				continue
+			}
+			if best == "" || unresolved[table] < unresolved[best] {
+				best = table
 			}
 		}
+		resolveTable(best)
 	}
 
 	// Finally, add tables with circular dependencies
@@ -1,13 +1,45 @@
 package connector
 
 import (
+	"fmt"
 	"os"
 	"testing"
 
 	"github.com/DATA-DOG/go-sqlmock"
+	"github.com/go-sql-driver/mysql"
 	"github.com/sirupsen/logrus"
 )
 
+// newTestLogger creates a logger that suppresses output during tests
+func newTestLogger() *logrus.Logger {
+	logger := logrus.New()
+	logger.SetLevel(logrus.FatalLevel)
+	return logger
+}
+
+// newMockConnector creates a DatabaseConnector backed by a sqlmock
+// database; the mock database is closed automatically when the test ends
+func newMockConnector(t *testing.T) (*DatabaseConnector, sqlmock.Sqlmock) {
+	t.Helper()
+
+	db, mock, err := sqlmock.New()
+	if err != nil {
+		t.Fatalf("Error creating mock database: %v", err)
+	}
+	t.Cleanup(func() { db.Close() })
+
+	connector := &DatabaseConnector{
+		Host:     "localhost",
+		User:     "user",
+		Password: "password",
+		Database: "database",
+		Port:     "3306",
+		DB:       db,
+		Logger:   newTestLogger(),
+	}
+	return connector, mock
+}
+
 func TestNewDatabaseConnector(t *testing.T) {
 	// Set environment variables for testing
 	os.Setenv("MYSQL_HOST", "test-host")
@@ -16,9 +48,7 @@ func TestNewDatabaseConnector(t *testing.T) {
 	os.Setenv("MYSQL_DATABASE", "test-database")
 	os.Setenv("MYSQL_PORT", "3307")
 
-	// Create a new logger for testing
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
+	logger := newTestLogger()
 
 	// Create a new database connector
 	db := NewDatabaseConnector("", "", "", "", "", logger)
@@ -62,27 +92,7 @@ func TestNewDatabaseConnector(t *testing.T) {
 }
 
 func TestExecuteQuery(t *testing.T) {
-	// Create a mock database
-	db, mock, err := sqlmock.New()
-	if err != nil {
-		t.Fatalf("Error creating mock database: %v", err)
-	}
-	defer db.Close()
-
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
-
-	// Create a database connector with the mock database
-	connector := &DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		DB:       db,
-		Logger:   logger,
-	}
+	connector, mock := newMockConnector(t)
 
 	// Set up expected query and result
 	rows := sqlmock.NewRows([]string{"id", "name"}).AddRow(1, "test")
@@ -112,27 +122,7 @@ func TestExecuteQuery(t *testing.T) {
 }
 
 func TestExecuteStatement(t *testing.T) {
-	// Create a mock database
-	db, mock, err := sqlmock.New()
-	if err != nil {
-		t.Fatalf("Error creating mock database: %v", err)
-	}
-	defer db.Close()
-
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
-
-	// Create a database connector with the mock database
-	connector := &DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		DB:       db,
-		Logger:   logger,
-	}
+	connector, mock := newMockConnector(t)
 
 	// Set up expected statement and result
 	mock.ExpectExec("INSERT INTO test").WithArgs(1, "test").WillReturnResult(sqlmock.NewResult(1, 1))
@@ -154,28 +144,33 @@ func TestExecuteStatement(t *testing.T) {
 	}
 }
 
-func TestExecuteMany(t *testing.T) {
-	// Create a mock database
-	db, mock, err := sqlmock.New()
-	if err != nil {
-		t.Fatalf("Error creating mock database: %v", err)
+func TestExecutePreparedStatement(t *testing.T) {
+	connector, mock := newMockConnector(t)
+
+	// The statement should be prepared once and executed twice
+	stmt := mock.ExpectPrepare("UPDATE test SET name = \\? WHERE id = \\?")
+	stmt.ExpectExec().WithArgs("test1", 1).WillReturnResult(sqlmock.NewResult(0, 1))
+	stmt.ExpectExec().WithArgs("test2", 2).WillReturnResult(sqlmock.NewResult(0, 1))
+
+	// Execute the statement twice with different parameters
+	for i, params := range [][]interface{}{{"test1", 1}, {"test2", 2}} {
+		affected, err := connector.ExecutePreparedStatement("UPDATE test SET name = ? WHERE id = ?", params...)
+		if err != nil {
+			t.Errorf("Error executing prepared statement %d: %v", i, err)
+		}
+		if affected != 1 {
+			t.Errorf("Expected 1 affected row for execution %d, got %d", i, affected)
+		}
 	}
-	defer db.Close()
-
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
 
-	// Create a database connector with the mock database
-	connector := &DatabaseConnector{
-		Host:     "localhost",
-		User:     "user",
-		Password: "password",
-		Database: "database",
-		Port:     "3306",
-		DB:       db,
-		Logger:   logger,
+	// Verify that all expectations were met
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Unfulfilled expectations: %v", err)
 	}
+}
+
+func TestExecuteMany(t *testing.T) {
+	connector, mock := newMockConnector(t)
 
 	// Set up expected transaction and statements
 	mock.ExpectBegin()
@@ -205,13 +200,188 @@ func TestExecuteMany(t *testing.T) {
 	}
 }
 
-func TestConnect(t *testing.T) {
-	// Create a logger
-	logger := logrus.New()
-	logger.SetLevel(logrus.FatalLevel) // Suppress log output during tests
+func TestQuoteIdentifier(t *testing.T) {
+	tests := []struct {
+		name       string
+		identifier string
+		expected   string
+	}{
+		{"plain identifier", "users", "`users`"},
+		{"reserved word", "order", "`order`"},
+		{"embedded backtick is doubled", "weird`name", "`weird``name`"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if quoted := QuoteIdentifier(tt.identifier); quoted != tt.expected {
+				t.Errorf("Expected '%s', got '%s'", tt.expected, quoted)
+			}
+		})
+	}
+}
+
+func TestExecuteBatchInsert(t *testing.T) {
+	connector, mock := newMockConnector(t)
+
+	// Both rows should be combined into a single multi-row INSERT,
+	// executed inside a single transaction
+	mock.ExpectBegin()
+	mock.ExpectExec("INSERT INTO test \\(id, name\\) VALUES \\(\\?, \\?\\), \\(\\?, \\?\\)").
+		WithArgs(1, "test1", 2, "test2").
+		WillReturnResult(sqlmock.NewResult(1, 2))
+	mock.ExpectCommit()
+
+	// Execute the batch insert
+	paramsList := [][]interface{}{
+		{1, "test1"},
+		{2, "test2"},
+	}
+	affected, firstInsertID, failedRows, err := connector.ExecuteBatchInsert("INSERT INTO test (id, name) VALUES", "(?, ?)", paramsList)
+	if err != nil {
+		t.Errorf("Error executing batch insert: %v", err)
+	}
+
+	// Check the result
+	if affected != 2 {
+		t.Errorf("Expected 2 affected rows, got %d", affected)
+	}
+	if firstInsertID != 1 {
+		t.Errorf("Expected first insert ID to be 1, got %d", firstInsertID)
+	}
+	if len(failedRows) != 0 {
+		t.Errorf("Expected no failed rows, got %v", failedRows)
+	}
+
+	// Verify that all expectations were met
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Unfulfilled expectations: %v", err)
+	}
+}
+
+func TestExecuteBatchInsertBisect(t *testing.T) {
+	connector, mock := newMockConnector(t)
+
+	// The combined multi-row INSERT fails, so the chunk is bisected; the
+	// first row succeeds on its own and the second row is dropped
+	mock.ExpectBegin()
+	mock.ExpectExec("INSERT INTO test \\(id, name\\) VALUES \\(\\?, \\?\\), \\(\\?, \\?\\)").
+		WithArgs(1, "test1", 2, "test2").
+		WillReturnError(fmt.Errorf("constraint violation"))
+	mock.ExpectExec("INSERT INTO test \\(id, name\\) VALUES \\(\\?, \\?\\)").
+		WithArgs(1, "test1").
+		WillReturnResult(sqlmock.NewResult(1, 1))
+	mock.ExpectExec("INSERT INTO test \\(id, name\\) VALUES \\(\\?, \\?\\)").
+		WithArgs(2, "test2").
+		WillReturnError(fmt.Errorf("constraint violation"))
+	mock.ExpectCommit()
+
+	// Execute the batch insert
+	paramsList := [][]interface{}{
+		{1, "test1"},
+		{2, "test2"},
+	}
+	affected, firstInsertID, failedRows, err := connector.ExecuteBatchInsert("INSERT INTO test (id, name) VALUES", "(?, ?)", paramsList)
+	if err != nil {
+		t.Errorf("Error executing batch insert: %v", err)
+	}
+
+	// Check the result: one row kept, one row dropped, no derived IDs
+	if affected != 1 {
+		t.Errorf("Expected 1 affected row, got %d", affected)
+	}
+	if firstInsertID != 0 {
+		t.Errorf("Expected first insert ID to be 0 after bisection, got %d", firstInsertID)
+	}
+	if len(failedRows) != 1 || failedRows[0] != 1 {
+		t.Errorf("Expected failed rows [1], got %v", failedRows)
+	}
+
+	// Verify that all expectations were met
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Unfulfilled expectations: %v", err)
+	}
+}
 
+func TestExecuteBatchInsertAbortsOnDeadlock(t *testing.T) {
+	connector, mock := newMockConnector(t)
+
+	// A deadlock rolls the transaction back server-side, so the batch
+	// must abort with the error instead of bisecting through the dead
+	// transaction
+	mock.ExpectBegin()
+	mock.ExpectExec("INSERT INTO test \\(id, name\\) VALUES \\(\\?, \\?\\), \\(\\?, \\?\\)").
+		WithArgs(1, "test1", 2, "test2").
+		WillReturnError(&mysql.MySQLError{Number: 1213, Message: "Deadlock found when trying to get lock"})
+	mock.ExpectRollback()
+
+	// Execute the batch insert
+	paramsList := [][]interface{}{
+		{1, "test1"},
+		{2, "test2"},
+	}
+	_, _, _, err := connector.ExecuteBatchInsert("INSERT INTO test (id, name) VALUES", "(?, ?)", paramsList)
+	if err == nil {
+		t.Error("Expected error for deadlocked batch insert, got nil")
+	}
+
+	// Verify that all expectations were met
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Unfulfilled expectations: %v", err)
+	}
+}
+
+func TestFormatLoadDataValue(t *testing.T) {
+	tests := []struct {
+		name     string
+		value    interface{}
+		expected string
+	}{
+		{"NULL becomes \\N", nil, "\\N"},
+		{"booleans become 0/1", true, "1"},
+		{"numbers are rendered plainly", 42, "42"},
+		{"special characters are escaped", "a\tb\nc\\d", "a\\tb\\nc\\\\d"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if formatted := formatLoadDataValue(tt.value); formatted != tt.expected {
+				t.Errorf("Expected '%s', got '%s'", tt.expected, formatted)
+			}
+		})
+	}
+}
+
+func TestExecuteLoadData(t *testing.T) {
+	connector, mock := newMockConnector(t)
+
+	// The rows should be streamed through a single LOAD DATA statement
+	mock.ExpectExec("LOAD DATA LOCAL INFILE 'Reader::populator-\\d+' INTO TABLE `test`").
+		WillReturnResult(sqlmock.NewResult(0, 2))
+
+	// Execute the bulk load
+	rows := [][]interface{}{
+		{1, "test1"},
+		{2, nil},
+	}
+	affected, err := connector.ExecuteLoadData("test", []string{"id", "name"}, rows)
+	if err != nil {
+		t.Errorf("Error executing bulk load: %v", err)
+	}
+
+	// Check the result
+	if affected != 2 {
+		t.Errorf("Expected 2 affected rows, got %d", affected)
+	}
+
+	// Verify that all expectations were met
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Unfulfilled expectations: %v", err)
+	}
+}
+
+func TestConnect(t *testing.T) {
 	// Create a database connector
-	connector := NewDatabaseConnector("localhost", "user", "password", "", "3306", logger)
+	connector := NewDatabaseConnector("localhost", "user", "password", "", "3306", newTestLogger())
 
 	// Test missing database name
 	err := connector.Connect()
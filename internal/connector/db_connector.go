@@ -1,12 +1,19 @@
 package connector
 
 import (
+	"bytes"
 	"database/sql"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
 
-	_ "github.com/go-sql-driver/mysql"
+	"github.com/go-sql-driver/mysql"
 	"github.com/sirupsen/logrus"
 )
 
@@ -19,6 +26,16 @@ type DatabaseConnector struct {
 	Port     string
 	DB       *sql.DB
 	Logger   *logrus.Logger
+
+	// stmtCache holds the server-side prepared statements reused across
+	// ExecutePreparedStatement calls, keyed by SQL text
+	stmtCache   map[string]*sql.Stmt
+	stmtCacheMu sync.Mutex
+
+	// allowLocalInfile announces the local-infile capability on new
+	// connections; it is off unless EnableLocalInfile has been called, so
+	// runs that never bulk load cannot be asked for local files
+	allowLocalInfile bool
 }
 
 // NewDatabaseConnector creates a new database connector
@@ -56,6 +73,12 @@ func (dc *DatabaseConnector) Connect() error {
 	}
 
 	dsn := fmt.Sprintf("%s:%s@tcp(%s:%s)/%s?parseTime=true", dc.User, dc.Password, dc.Host, dc.Port, dc.Database)
+	if dc.allowLocalInfile {
+		// Announce the local-infile capability so the bulk LOAD DATA
+		// LOCAL INFILE path (ExecuteLoadData) works on connections opened
+		// before its virtual file is registered
+		dsn += "&allowAllFiles=true"
+	}
 	db, err := sql.Open("mysql", dsn)
 	if err != nil {
 		dc.Logger.Errorf("Error connecting to MySQL database: %v", err)
@@ -76,6 +99,13 @@ func (dc *DatabaseConnector) Connect() error {
 
 // Disconnect closes the database connection
 func (dc *DatabaseConnector) Disconnect() {
+	dc.stmtCacheMu.Lock()
+	for _, stmt := range dc.stmtCache {
+		stmt.Close()
+	}
+	dc.stmtCache = nil
+	dc.stmtCacheMu.Unlock()
+
 	if dc.DB != nil {
 		err := dc.DB.Close()
 		if err != nil {
@@ -175,6 +205,370 @@ func (dc *DatabaseConnector) ExecuteStatement(query string, params ...interface{
 	return affected, nil
 }
 
+// getPreparedStatement returns the cached server-side prepared statement
+// for the given SQL, preparing it on first use. Statements stay prepared
+// until Disconnect, so repeated executions skip the server's parse and
+// plan step and use the binary protocol.
+func (dc *DatabaseConnector) getPreparedStatement(query string) (*sql.Stmt, error) {
+	dc.stmtCacheMu.Lock()
+	defer dc.stmtCacheMu.Unlock()
+
+	if stmt, ok := dc.stmtCache[query]; ok {
+		return stmt, nil
+	}
+
+	stmt, err := dc.DB.Prepare(query)
+	if err != nil {
+		return nil, err
+	}
+
+	if dc.stmtCache == nil {
+		dc.stmtCache = make(map[string]*sql.Stmt)
+	}
+	dc.stmtCache[query] = stmt
+	return stmt, nil
+}
+
+// ExecutePreparedStatement executes a SQL statement through the prepared
+// statement cache and returns the number of affected rows. Use this
+// instead of ExecuteStatement for statements that run many times with
+// different parameters.
+func (dc *DatabaseConnector) ExecutePreparedStatement(query string, params ...interface{}) (int64, error) {
+	if dc.DB == nil {
+		if err := dc.Connect(); err != nil {
+			return 0, err
+		}
+	}
+
+	stmt, err := dc.getPreparedStatement(query)
+	if err != nil {
+		dc.Logger.Errorf("Error preparing statement: %v", err)
+		return 0, err
+	}
+
+	result, err := stmt.Exec(params...)
+	if err != nil {
+		dc.Logger.Errorf("Error executing prepared statement: %v", err)
+		return 0, err
+	}
+
+	affected, err := result.RowsAffected()
+	if err != nil {
+		dc.Logger.Errorf("Error getting affected rows: %v", err)
+		return 0, err
+	}
+
+	return affected, nil
+}
+
+// QuoteIdentifier wraps a table or column name in backticks so generated
+// SQL is safe for reserved words and unusual identifier characters
+func QuoteIdentifier(name string) string {
+	return "`" + strings.ReplaceAll(name, "`", "``") + "`"
+}
+
+// maxBatchRows limits how many rows are combined into a single multi-row
+// INSERT statement, keeping the statement safely below MySQL's default
+// max_allowed_packet size.
+const maxBatchRows = 500
+
+// ExecuteBatchInsert executes a multi-row INSERT statement for the given
+// parameter sets. insertPrefix is the statement up to and including the
+// VALUES keyword (e.g. "INSERT INTO t (a, b) VALUES"), and rowPlaceholders
+// is the placeholder group for a single row (e.g. "(?, ?)"). Parameter sets
+// are combined into chunks of up to maxBatchRows rows, so the whole batch
+// costs one round trip per chunk instead of one per row. All chunks run in
+// a single transaction, so the batch commits (and fsyncs) once and rolls
+// back as a whole if any chunk fails.
+//
+// The returned ID is the auto-increment ID assigned to the first inserted
+// row (0 if the table has no auto-increment column). MySQL assigns
+// contiguous IDs to the rows of a multi-row INSERT (with
+// innodb_autoinc_lock_mode <= 1), so row i received ID firstID + i.
+//
+// If a chunk fails, the chunk is bisected to isolate the offending rows,
+// which are dropped; the returned slice holds the indices (into
+// paramsList) of dropped rows. When rows have been dropped the returned
+// first-row ID is 0, since the remaining IDs are no longer contiguous.
+func (dc *DatabaseConnector) ExecuteBatchInsert(insertPrefix, rowPlaceholders string, paramsList [][]interface{}) (int64, int64, []int, error) {
+	if dc.DB == nil {
+		if err := dc.Connect(); err != nil {
+			return 0, 0, nil, err
+		}
+	}
+
+	// Start a transaction
+	tx, err := dc.DB.Begin()
+	if err != nil {
+		dc.Logger.Errorf("Error starting transaction: %v", err)
+		return 0, 0, nil, err
+	}
+
+	var totalAffected int64
+	var firstInsertID int64
+	var failedRows []int
+
+	for start := 0; start < len(paramsList); start += maxBatchRows {
+		end := start + maxBatchRows
+		if end > len(paramsList) {
+			end = len(paramsList)
+		}
+		chunk := paramsList[start:end]
+
+		result, err := dc.execChunkRows(tx, insertPrefix, rowPlaceholders, chunk)
+		if err != nil {
+			// An error that terminated the transaction server-side (e.g.
+			// a deadlock rollback) makes further statements meaningless —
+			// the earlier chunks are already lost, so abort the batch
+			if isTxFatalError(err) {
+				dc.Logger.Errorf("Transaction aborted during batch insert: %v", err)
+				tx.Rollback()
+				return 0, 0, nil, err
+			}
+
+			// The combined statement itself may be the problem (e.g. it
+			// exceeds max_allowed_packet), or a few rows may violate a
+			// constraint; bisect the chunk to isolate and drop only the
+			// offending rows
+			dc.Logger.Warningf("Multi-row insert failed (%v), bisecting chunk to isolate bad rows", err)
+
+			affected, bisectErr := dc.execChunkBisect(tx, insertPrefix, rowPlaceholders, chunk, start, &failedRows, err)
+			if bisectErr != nil {
+				dc.Logger.Errorf("Error executing batch insert: %v", bisectErr)
+				tx.Rollback()
+				return 0, 0, nil, bisectErr
+			}
+
+			totalAffected += affected
+			continue
+		}
+
+		affected, err := result.RowsAffected()
+		if err != nil {
+			dc.Logger.Errorf("Error getting affected rows: %v", err)
+			tx.Rollback()
+			return 0, 0, nil, err
+		}
+
+		// The driver reports the ID of the first row of each statement;
+		// remember the first chunk's so callers can derive the rest
+		if start == 0 {
+			if insertID, err := result.LastInsertId(); err == nil {
+				firstInsertID = insertID
+			}
+		}
+
+		totalAffected += affected
+	}
+
+	// Commit the transaction
+	if err := tx.Commit(); err != nil {
+		dc.Logger.Errorf("Error committing transaction: %v", err)
+		tx.Rollback()
+		return 0, 0, nil, err
+	}
+
+	// Once any row has gone through bisection the auto-increment IDs are
+	// no longer contiguous, so callers must not derive them
+	if len(failedRows) > 0 {
+		firstInsertID = 0
+	}
+
+	return totalAffected, firstInsertID, failedRows, nil
+}
+
+// execChunkRows builds and executes the multi-row INSERT statement for a
+// slice of parameter sets
+func (dc *DatabaseConnector) execChunkRows(tx *sql.Tx, insertPrefix, rowPlaceholders string, chunk [][]interface{}) (sql.Result, error) {
+	// Build "INSERT ... VALUES (?, ?), (?, ?), ..." for this chunk
+	placeholderGroups := make([]string, len(chunk))
+	for i := range chunk {
+		placeholderGroups[i] = rowPlaceholders
+	}
+	query := insertPrefix + " " + strings.Join(placeholderGroups, ", ")
+
+	// Flatten the parameter sets into a single argument list
+	var params []interface{}
+	for _, rowParams := range chunk {
+		params = append(params, rowParams...)
+	}
+
+	return tx.Exec(query, params...)
+}
+
+// isTxFatalError reports whether an execution error has implicitly
+// rolled back the transaction server-side, in which case continuing to
+// execute and commit on it would silently lose the earlier chunks.
+func isTxFatalError(err error) bool {
+	var mysqlErr *mysql.MySQLError
+	if errors.As(err, &mysqlErr) {
+		// 1213: deadlock found, transaction rolled back
+		// 1205: lock wait timeout, rolls the transaction back when
+		// innodb_rollback_on_timeout is set; abort conservatively
+		return mysqlErr.Number == 1213 || mysqlErr.Number == 1205
+	}
+	return false
+}
+
+// execChunkBisect isolates the bad rows of a chunk whose combined
+// statement has already failed with cause: the chunk is split in half
+// immediately (re-running the known-bad statement would waste a round
+// trip), halves that execute cleanly are kept, and failing halves
+// recurse, so a few bad rows cost O(log n) statements to isolate. Rows
+// that fail on their own are dropped and their indices (offset into the
+// original parameter list) appended to failedRows. Errors that terminate
+// the transaction abort the bisection.
+func (dc *DatabaseConnector) execChunkBisect(tx *sql.Tx, insertPrefix, rowPlaceholders string, chunk [][]interface{}, offset int, failedRows *[]int, cause error) (int64, error) {
+	if len(chunk) == 1 {
+		// Isolated a failing row; drop it and carry on with the rest
+		dc.Logger.Warningf("Dropping row that failed to insert: %v", cause)
+		*failedRows = append(*failedRows, offset)
+		return 0, nil
+	}
+
+	mid := len(chunk) / 2
+	var totalAffected int64
+
+	for _, half := range []struct {
+		rows   [][]interface{}
+		offset int
+	}{
+		{chunk[:mid], offset},
+		{chunk[mid:], offset + mid},
+	} {
+		result, err := dc.execChunkRows(tx, insertPrefix, rowPlaceholders, half.rows)
+		if err != nil {
+			if isTxFatalError(err) {
+				return totalAffected, err
+			}
+
+			affected, bisectErr := dc.execChunkBisect(tx, insertPrefix, rowPlaceholders, half.rows, half.offset, failedRows, err)
+			if bisectErr != nil {
+				return totalAffected + affected, bisectErr
+			}
+			totalAffected += affected
+			continue
+		}
+
+		affected, err := result.RowsAffected()
+		if err != nil {
+			return totalAffected, err
+		}
+		totalAffected += affected
+	}
+
+	return totalAffected, nil
+}
+
+// EnableLocalInfile opts this connector into LOAD DATA LOCAL INFILE
+// support. Letting a server request local files is an exposure, so the
+// capability is only announced once a caller actually intends to bulk
+// load; an existing connection pool is reopened so the handshake flag
+// takes effect.
+func (dc *DatabaseConnector) EnableLocalInfile() error {
+	if dc.allowLocalInfile {
+		return nil
+	}
+
+	dc.allowLocalInfile = true
+	if dc.DB != nil {
+		dc.Disconnect()
+		return dc.Connect()
+	}
+	return nil
+}
+
+// LocalInfileEnabled reports whether EnableLocalInfile has been called
+func (dc *DatabaseConnector) LocalInfileEnabled() bool {
+	return dc.allowLocalInfile
+}
+
+// loadDataSeq numbers the virtual files registered for LOAD DATA LOCAL
+// INFILE so concurrent bulk loads do not collide
+var loadDataSeq uint64
+
+// ExecuteLoadData streams rows into a table with LOAD DATA LOCAL INFILE.
+// The rows are rendered as tab-separated text (with \N for NULL) into an
+// in-memory buffer that is served to the driver as a virtual file, so
+// very large batches bypass the server's SQL parser entirely. The server
+// must permit local_infile; callers should fall back to batched INSERT
+// statements when this returns an error.
+func (dc *DatabaseConnector) ExecuteLoadData(table string, columns []string, rows [][]interface{}) (int64, error) {
+	if dc.DB == nil {
+		if err := dc.Connect(); err != nil {
+			return 0, err
+		}
+	}
+
+	var buf bytes.Buffer
+	for _, row := range rows {
+		for i, value := range row {
+			if i > 0 {
+				buf.WriteByte('\t')
+			}
+			buf.WriteString(formatLoadDataValue(value))
+		}
+		buf.WriteByte('\n')
+	}
+
+	readerName := fmt.Sprintf("populator-%d", atomic.AddUint64(&loadDataSeq, 1))
+	mysql.RegisterReaderHandler(readerName, func() io.Reader {
+		return bytes.NewReader(buf.Bytes())
+	})
+	defer mysql.DeregisterReaderHandler(readerName)
+
+	quotedColumns := make([]string, len(columns))
+	for i, column := range columns {
+		quotedColumns[i] = QuoteIdentifier(column)
+	}
+
+	query := fmt.Sprintf(
+		"LOAD DATA LOCAL INFILE 'Reader::%s' INTO TABLE %s FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' (%s)",
+		readerName,
+		QuoteIdentifier(table),
+		strings.Join(quotedColumns, ", "),
+	)
+
+	result, err := dc.DB.Exec(query)
+	if err != nil {
+		dc.Logger.Errorf("Error executing LOAD DATA for table %s: %v", table, err)
+		return 0, err
+	}
+
+	return result.RowsAffected()
+}
+
+// loadDataEscaper escapes the characters that would break a
+// tab-separated LOAD DATA stream
+var loadDataEscaper = strings.NewReplacer(
+	"\\", "\\\\",
+	"\t", "\\t",
+	"\n", "\\n",
+	"\r", "\\r",
+)
+
+// formatLoadDataValue renders a single value for a tab-separated LOAD
+// DATA stream
+func formatLoadDataValue(value interface{}) string {
+	switch v := value.(type) {
+	case nil:
+		return "\\N"
+	case bool:
+		if v {
+			return "1"
+		}
+		return "0"
+	case time.Time:
+		return v.Format("2006-01-02 15:04:05")
+	case []byte:
+		return loadDataEscaper.Replace(string(v))
+	case string:
+		return loadDataEscaper.Replace(v)
+	default:
+		return fmt.Sprintf("%v", v)
+	}
+}
+
 // ExecuteMany executes a SQL statement with multiple parameter sets
 func (dc *DatabaseConnector) ExecuteMany(query string, paramsList [][]interface{}) (int64, error) {
 	if dc.DB == nil {
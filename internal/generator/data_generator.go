@@ -20,6 +20,7 @@ type DataGenerator struct {
 	SchemaAnalyzer *analyzer.SchemaAnalyzer
 	CurrentRecord  map[string]interface{}
 	Logger         *logrus.Logger
+	generators     map[string]func() interface{}
 }
 
 // NewDataGenerator creates a new data generator
@@ -29,6 +30,7 @@ func NewDataGenerator(schemaAnalyzer *analyzer.SchemaAnalyzer, logger *logrus.Lo
 		SchemaAnalyzer: schemaAnalyzer,
 		CurrentRecord:  make(map[string]interface{}),
 		Logger:         logger,
+		generators:     make(map[string]func() interface{}),
 	}
 }
 
@@ -39,108 +41,134 @@ func (dg *DataGenerator) GenerateData(table string, column models.Column) interf
 		dg.CurrentRecord = make(map[string]interface{})
 	}
 
+	return dg.GeneratorFor(table, column)()
+}
+
+// GeneratorFor resolves the generator for a column — the column-name
+// keyword matching and the data-type dispatch — once, and returns a
+// closure that only produces values. Resolved generators are cached per
+// (table, column), so repeated row generation skips the string matching
+// entirely.
+func (dg *DataGenerator) GeneratorFor(table string, column models.Column) func() interface{} {
+	cacheKey := table + "." + column.Name
+	if generate, ok := dg.generators[cacheKey]; ok {
+		return generate
+	}
+
+	generate := dg.resolveGenerator(column)
+	dg.generators[cacheKey] = generate
+	return generate
+}
+
+// resolveGenerator picks the value producer for a column based on its
+// name and data type
+func (dg *DataGenerator) resolveGenerator(column models.Column) func() interface{} {
 	// Check for special column names
 	columnName := strings.ToLower(column.Name)
 	dataType := strings.ToLower(column.DataType)
 
 	// Handle special column names
 	if strings.Contains(columnName, "email") {
-		return dg.Faker.Internet().Email()
+		return func() interface{} { return dg.Faker.Internet().Email() }
 	} else if strings.Contains(columnName, "name") && !strings.Contains(columnName, "file") {
 		if strings.Contains(columnName, "first") {
-			return dg.Faker.Person().FirstName()
+			return func() interface{} { return dg.Faker.Person().FirstName() }
 		} else if strings.Contains(columnName, "last") {
-			return dg.Faker.Person().LastName()
+			return func() interface{} { return dg.Faker.Person().LastName() }
 		} else if strings.Contains(columnName, "full") {
-			return dg.Faker.Person().Name()
+			return func() interface{} { return dg.Faker.Person().Name() }
 		} else if strings.Contains(columnName, "user") {
-			return dg.Faker.Internet().User()
+			return func() interface{} { return dg.Faker.Internet().User() }
 		} else if strings.Contains(columnName, "company") || strings.Contains(columnName, "business") {
-			return dg.Faker.Company().Name()
+			return func() interface{} { return dg.Faker.Company().Name() }
 		} else {
-			return dg.Faker.Person().Name()
+			return func() interface{} { return dg.Faker.Person().Name() }
 		}
 	} else if strings.Contains(columnName, "phone") {
-		return dg.Faker.Phone().Number()
+		return func() interface{} { return dg.Faker.Phone().Number() }
 	} else if strings.Contains(columnName, "address") {
-		return dg.Faker.Address().Address()
+		return func() interface{} { return dg.Faker.Address().Address() }
 	} else if strings.Contains(columnName, "city") {
-		return dg.Faker.Address().City()
+		return func() interface{} { return dg.Faker.Address().City() }
 	} else if strings.Contains(columnName, "state") {
-		return dg.Faker.Address().State()
+		return func() interface{} { return dg.Faker.Address().State() }
 	} else if strings.Contains(columnName, "country") {
-		return dg.Faker.Address().Country()
+		return func() interface{} { return dg.Faker.Address().Country() }
 	} else if strings.Contains(columnName, "zip") || strings.Contains(columnName, "postal") {
-		return dg.Faker.Address().PostCode()
+		return func() interface{} { return dg.Faker.Address().PostCode() }
 	} else if strings.Contains(columnName, "lat") || strings.Contains(columnName, "latitude") {
-		return dg.Faker.Address().Latitude()
+		return func() interface{} { return dg.Faker.Address().Latitude() }
 	} else if strings.Contains(columnName, "lon") || strings.Contains(columnName, "longitude") {
-		return dg.Faker.Address().Longitude()
+		return func() interface{} { return dg.Faker.Address().Longitude() }
 	} else if strings.Contains(columnName, "description") || strings.Contains(columnName, "summary") {
-		return dg.Faker.Lorem().Paragraph(3)
+		return func() interface{} { return dg.Faker.Lorem().Paragraph(3) }
 	} else if strings.Contains(columnName, "title") {
-		return dg.Faker.Lorem().Sentence(4)
+		return func() interface{} { return dg.Faker.Lorem().Sentence(4) }
 	} else if strings.Contains(columnName, "url") || strings.Contains(columnName, "website") {
-		return dg.Faker.Internet().URL()
+		return func() interface{} { return dg.Faker.Internet().URL() }
 	} else if strings.Contains(columnName, "ip") {
-		return dg.Faker.Internet().Ipv4()
+		return func() interface{} { return dg.Faker.Internet().Ipv4() }
 	} else if strings.Contains(columnName, "password") {
-		return dg.Faker.Internet().Password()
+		return func() interface{} { return dg.Faker.Internet().Password() }
 	} else if strings.Contains(columnName, "token") {
-		return dg.Faker.RandomStringWithLength(32)
+		return func() interface{} { return dg.Faker.RandomStringWithLength(32) }
 	} else if strings.Contains(columnName, "color") {
-		return dg.Faker.Color().Hex()
+		return func() interface{} { return dg.Faker.Color().Hex() }
 	} else if strings.Contains(columnName, "filename") || strings.Contains(columnName, "file_name") {
-		return dg.Faker.File().FilenameWithExtension()
+		return func() interface{} { return dg.Faker.File().FilenameWithExtension() }
 	} else if strings.Contains(columnName, "mimetype") || strings.Contains(columnName, "mime_type") {
-		return "application/" + dg.Faker.Lorem().Word()
+		return func() interface{} { return "application/" + dg.Faker.Lorem().Word() }
 	} else if strings.Contains(columnName, "uuid") {
-		return dg.Faker.UUID().V4()
+		return func() interface{} { return dg.Faker.UUID().V4() }
 	} else if strings.Contains(columnName, "created_at") || strings.Contains(columnName, "updated_at") {
-		return time.Now().Add(-time.Duration(rand.Intn(30)) * 24 * time.Hour)
+		return func() interface{} {
+			return time.Now().Add(-time.Duration(rand.Intn(30)) * 24 * time.Hour)
+		}
 	} else if strings.Contains(columnName, "deleted_at") {
-		// 70% chance of being null for deleted_at
-		if rand.Float32() < 0.7 {
-			return nil
+		return func() interface{} {
+			// 70% chance of being null for deleted_at
+			if rand.Float32() < 0.7 {
+				return nil
+			}
+			return time.Now().Add(-time.Duration(rand.Intn(10)) * 24 * time.Hour)
 		}
-		return time.Now().Add(-time.Duration(rand.Intn(10)) * 24 * time.Hour)
 	}
 
 	// Generate data based on data type
 	switch dataType {
 	case "varchar", "char", "text", "tinytext", "mediumtext", "longtext":
-		return dg.generateString(column)
+		return func() interface{} { return dg.generateString(column) }
 	case "int", "tinyint", "smallint", "mediumint", "bigint":
-		return dg.generateInteger(column)
+		return dg.integerGenerator(column)
 	case "float", "double", "decimal":
-		return dg.generateFloat(column)
+		return dg.floatGenerator(column)
 	case "date":
-		return dg.generateDate()
+		return func() interface{} { return dg.generateDate() }
 	case "time":
-		return dg.generateTime()
+		return func() interface{} { return dg.generateTime() }
 	case "datetime", "timestamp":
-		return dg.generateDateTime()
+		return func() interface{} { return dg.generateDateTime() }
 	case "year":
-		return dg.generateYear()
+		return func() interface{} { return dg.generateYear() }
 	case "enum":
-		return dg.generateEnum(column)
+		return dg.enumGenerator(column)
 	case "set":
-		return dg.generateSet(column)
+		return dg.setGenerator(column)
 	case "bit":
-		return dg.generateBit(column)
+		return dg.bitGenerator(column)
 	case "binary", "varbinary":
-		return dg.generateBinary(column)
+		return func() interface{} { return dg.generateBinary(column) }
 	case "blob", "tinyblob", "mediumblob", "longblob":
-		return dg.generateBlob(column)
+		return func() interface{} { return dg.generateBlob(column) }
 	case "json":
-		return dg.generateJSON(column)
+		return func() interface{} { return dg.generateJSON(column) }
 	case "point", "linestring", "polygon", "geometry", "multipoint", "multilinestring", "multipolygon", "geometrycollection":
-		return dg.generateSpatial(column)
+		return func() interface{} { return dg.generateSpatial(column) }
 	case "boolean", "bool":
-		return rand.Intn(2) == 1
+		return func() interface{} { return rand.Intn(2) == 1 }
 	default:
 		dg.Logger.Warningf("No specific generator for type %s, using default string", dataType)
-		return dg.Faker.Lorem().Word()
+		return func() interface{} { return dg.Faker.Lorem().Word() }
 	}
 }
 
@@ -186,66 +214,77 @@ func (dg *DataGenerator) generateString(column models.Column) string {
 	}
 }
 
-// generateInteger generates an integer value based on column constraints
-func (dg *DataGenerator) generateInteger(column models.Column) interface{} {
+// integerGenerator resolves an integer generator for a column; the type
+// and signedness checks run once here, so the returned closure is a bare
+// random draw
+func (dg *DataGenerator) integerGenerator(column models.Column) func() interface{} {
+	dataType := strings.ToLower(column.DataType)
+	columnType := strings.ToLower(column.ColumnType)
+	unsigned := strings.Contains(columnType, "unsigned")
+
 	// Check for boolean tinyint
-	if strings.ToLower(column.DataType) == "tinyint" && strings.Contains(strings.ToLower(column.ColumnType), "tinyint(1)") {
-		return rand.Intn(2)
+	if dataType == "tinyint" && strings.Contains(columnType, "tinyint(1)") {
+		return func() interface{} { return rand.Intn(2) }
 	}
 
 	// Check for auto_increment
 	if strings.Contains(strings.ToLower(column.Extra), "auto_increment") {
-		return nil // Let MySQL handle auto_increment
+		return func() interface{} { return nil } // Let MySQL handle auto_increment
 	}
 
 	// Generate based on type
-	switch strings.ToLower(column.DataType) {
+	switch dataType {
 	case "tinyint":
-		if strings.Contains(strings.ToLower(column.ColumnType), "unsigned") {
-			return uint8(rand.Intn(256))
+		if unsigned {
+			return func() interface{} { return uint8(rand.Intn(256)) }
 		}
-		return int8(rand.Intn(256) - 128)
+		return func() interface{} { return int8(rand.Intn(256) - 128) }
 	case "smallint":
-		if strings.Contains(strings.ToLower(column.ColumnType), "unsigned") {
-			return uint16(rand.Intn(65536))
+		if unsigned {
+			return func() interface{} { return uint16(rand.Intn(65536)) }
 		}
-		return int16(rand.Intn(65536) - 32768)
+		return func() interface{} { return int16(rand.Intn(65536) - 32768) }
 	case "mediumint":
-		if strings.Contains(strings.ToLower(column.ColumnType), "unsigned") {
-			return uint32(rand.Intn(16777216))
+		if unsigned {
+			return func() interface{} { return uint32(rand.Intn(16777216)) }
 		}
-		return int32(rand.Intn(16777216) - 8388608)
+		return func() interface{} { return int32(rand.Intn(16777216) - 8388608) }
 	case "int":
-		if strings.Contains(strings.ToLower(column.ColumnType), "unsigned") {
-			return uint32(rand.Uint32())
+		if unsigned {
+			return func() interface{} { return uint32(rand.Uint32()) }
 		}
-		return int32(rand.Int31())
+		return func() interface{} { return int32(rand.Int31()) }
 	case "bigint":
-		if strings.Contains(strings.ToLower(column.ColumnType), "unsigned") {
-			return uint64(rand.Uint64())
+		if unsigned {
+			return func() interface{} { return uint64(rand.Uint64()) }
 		}
-		return int64(rand.Int63())
+		return func() interface{} { return int64(rand.Int63()) }
 	default:
-		return rand.Int31()
+		return func() interface{} { return rand.Int31() }
 	}
 }
 
-// generateFloat generates a float value based on column constraints
-func (dg *DataGenerator) generateFloat(column models.Column) interface{} {
-	// Generate a random float
-	value := rand.Float64() * 1000
-
-	// Round based on scale if available
+// floatGenerator resolves a float generator for a column, computing the
+// rounding multiplier for the column's scale once
+func (dg *DataGenerator) floatGenerator(column models.Column) func() interface{} {
+	multiplier := 0.0
 	if column.NumericScale != nil {
-		scale := *column.NumericScale
-		multiplier := 1.0
-		for i := int64(0); i < scale; i++ {
+		multiplier = 1.0
+		for i := int64(0); i < *column.NumericScale; i++ {
 			multiplier *= 10
 		}
-		value = float64(int64(value*multiplier)) / multiplier
 	}
 
-	return value
+	return func() interface{} {
+		value := rand.Float64() * 1000
+
+		// Round based on scale if available
+		if multiplier > 0 {
+			value = float64(int64(value*multiplier)) / multiplier
+		}
+
+		return value
+	}
 }
 
 // generateDate generates a random date
@@ -285,21 +324,25 @@ func (dg *DataGenerator) generateYear() int {
 	return rand.Intn(currentYear-1970+1) + 1970
 }
 
-// generateEnum generates a random enum value
-func (dg *DataGenerator) generateEnum(column models.Column) string {
-	// Extract enum values from column type
-	// Format is typically: "enum('value1','value2','value3')"
-	enumRegex := regexp.MustCompile(`enum\((.+)\)`)
-	matches := enumRegex.FindStringSubmatch(column.ColumnType)
+// Regexes for parsing enum/set/bit column type definitions, compiled
+// once instead of once per generated value
+var (
+	enumValuesRegex  = regexp.MustCompile(`enum\((.+)\)`)
+	setValuesRegex   = regexp.MustCompile(`set\((.+)\)`)
+	quotedValueRegex = regexp.MustCompile(`'([^']*)'`)
+	bitLengthRegex   = regexp.MustCompile(`bit\((\d+)\)`)
+)
 
+// parseTypeValues extracts the quoted value list from an enum or set
+// column type definition, e.g. "enum('value1','value2','value3')"
+func parseTypeValues(columnType string, typeRegex *regexp.Regexp) []string {
+	matches := typeRegex.FindStringSubmatch(columnType)
 	if len(matches) < 2 {
-		return ""
+		return nil
 	}
 
 	// Split the values and remove quotes
-	valuesStr := matches[1]
-	valueRegex := regexp.MustCompile(`'([^']*)'`)
-	valueMatches := valueRegex.FindAllStringSubmatch(valuesStr, -1)
+	valueMatches := quotedValueRegex.FindAllStringSubmatch(matches[1], -1)
 
 	var values []string
 	for _, match := range valueMatches {
@@ -307,75 +350,63 @@ func (dg *DataGenerator) generateEnum(column models.Column) string {
 			values = append(values, match[1])
 		}
 	}
+	return values
+}
 
+// enumGenerator resolves an enum generator for a column, parsing the
+// value list from the column type once
+func (dg *DataGenerator) enumGenerator(column models.Column) func() interface{} {
+	values := parseTypeValues(column.ColumnType, enumValuesRegex)
 	if len(values) == 0 {
-		return ""
+		return func() interface{} { return "" }
 	}
 
 	// Return a random value
-	return values[rand.Intn(len(values))]
+	return func() interface{} { return values[rand.Intn(len(values))] }
 }
 
-// generateSet generates a random set value
-func (dg *DataGenerator) generateSet(column models.Column) string {
-	// Extract set values from column type
-	// Format is typically: "set('value1','value2','value3')"
-	setRegex := regexp.MustCompile(`set\((.+)\)`)
-	matches := setRegex.FindStringSubmatch(column.ColumnType)
-
-	if len(matches) < 2 {
-		return ""
+// setGenerator resolves a set generator for a column, parsing the value
+// list from the column type once
+func (dg *DataGenerator) setGenerator(column models.Column) func() interface{} {
+	values := parseTypeValues(column.ColumnType, setValuesRegex)
+	if len(values) == 0 {
+		return func() interface{} { return "" }
 	}
 
-	// Split the values and remove quotes
-	valuesStr := matches[1]
-	valueRegex := regexp.MustCompile(`'([^']*)'`)
-	valueMatches := valueRegex.FindAllStringSubmatch(valuesStr, -1)
+	return func() interface{} {
+		// Select a random number of values (1 to all)
+		numValues := rand.Intn(len(values)) + 1
+		selectedIndices := rand.Perm(len(values))[:numValues]
 
-	var values []string
-	for _, match := range valueMatches {
-		if len(match) >= 2 {
-			values = append(values, match[1])
+		var selectedValues []string
+		for _, idx := range selectedIndices {
+			selectedValues = append(selectedValues, values[idx])
 		}
-	}
-
-	if len(values) == 0 {
-		return ""
-	}
 
-	// Select a random number of values (1 to all)
-	numValues := rand.Intn(len(values)) + 1
-	selectedIndices := rand.Perm(len(values))[:numValues]
-
-	var selectedValues []string
-	for _, idx := range selectedIndices {
-		selectedValues = append(selectedValues, values[idx])
+		return strings.Join(selectedValues, ",")
 	}
-
-	return strings.Join(selectedValues, ",")
 }
 
-// generateBit generates a random bit value
-func (dg *DataGenerator) generateBit(column models.Column) interface{} {
-	// Extract the bit length from column type
-	// Format is typically: "bit(n)"
-	bitRegex := regexp.MustCompile(`bit\((\d+)\)`)
-	matches := bitRegex.FindStringSubmatch(column.ColumnType)
-
+// bitGenerator resolves a bit generator for a column, parsing the bit
+// length from the column type (typically "bit(n)") once
+func (dg *DataGenerator) bitGenerator(column models.Column) func() interface{} {
 	var length int = 1
-	if len(matches) >= 2 {
+	if matches := bitLengthRegex.FindStringSubmatch(column.ColumnType); len(matches) >= 2 {
 		fmt.Sscanf(matches[1], "%d", &length)
 	}
 
-	// Generate a random bit value
+	// Single bits come back as 0/1
 	if length == 1 {
-		return rand.Intn(2)
+		return func() interface{} { return rand.Intn(2) }
 	}
 
 	// For longer bit fields, return a byte array
-	bytes := make([]byte, (length+7)/8)
-	rand.Read(bytes)
-	return bytes
+	numBytes := (length + 7) / 8
+	return func() interface{} {
+		bytes := make([]byte, numBytes)
+		rand.Read(bytes)
+		return bytes
+	}
 }
 
 // generateBinary generates random binary data
@@ -2,7 +2,10 @@ package populator
 
 import (
 	"fmt"
+	"math/rand"
+	"sort"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/sirupsen/logrus"
@@ -22,6 +25,64 @@ type DatabasePopulator struct {
 	InsertedData   map[string][]map[string]interface{}
 	FailedTables   map[string]bool
 	Logger         *logrus.Logger
+	plans          map[string]*tablePlan
+	rng            *rand.Rand
+	mu             sync.Mutex
+
+	// Column-oriented pools of inserted values, kept only for the
+	// (table, column) pairs that foreign keys actually reference. Wide
+	// tables no longer pin every generated record in memory just so a
+	// single key column can be sampled.
+	fkValues       map[string]map[string][]interface{}
+	referencedCols map[string]map[string]bool
+	insertedCounts map[string]int
+	retainRecords  map[string]bool
+
+	// circularTables caches the analyzer's circular-dependency set for
+	// the duration of the run; computing it is O(tables^2)
+	circularTables map[string]bool
+}
+
+// maxConcurrentTables bounds how many tables of a dependency level are
+// populated at the same time; each in-flight table holds one connection
+// and transaction, so this keeps a wide level well below MySQL's default
+// max_connections
+const maxConcurrentTables = 8
+
+// columnOpKind identifies how the value for a column is produced
+type columnOpKind int
+
+const (
+	// opGenerate produces a fake value from the data generator
+	opGenerate columnOpKind = iota
+	// opForeignKey picks a value from the referenced table's inserted data
+	opForeignKey
+	// opCircularForeignKey is a foreign key into a circular dependency;
+	// it is left NULL (or given a placeholder value if NOT NULL) during
+	// the first pass and fixed up by the second-pass UPDATE
+	opCircularForeignKey
+)
+
+// columnOp describes how to produce the value for a single column.
+// Generate is the column's resolved generator closure, so row generation
+// skips the data generator's per-value name and type dispatch.
+type columnOp struct {
+	Name       string
+	Kind       columnOpKind
+	Column     models.Column
+	ForeignKey models.ForeignKey
+	Generate   func() interface{}
+}
+
+// tablePlan holds the per-table work that can be computed once instead of
+// once per row: the column ops, the INSERT statement parts, and the
+// auto-increment column (if any)
+type tablePlan struct {
+	Table               string
+	Ops                 []columnOp
+	InsertPrefix        string
+	RowPlaceholders     string
+	AutoIncrementColumn string
 }
 
 // NewDatabasePopulator creates a new database populator
@@ -42,7 +103,84 @@ func NewDatabasePopulator(
 		InsertedData:   make(map[string][]map[string]interface{}),
 		FailedTables:   make(map[string]bool),
 		Logger:         logger,
+		plans:          make(map[string]*tablePlan),
+		rng:            rand.New(rand.NewSource(time.Now().UnixNano())),
+	}
+}
+
+// compilePlan builds the plan for a table: one op per insertable column,
+// with foreign keys resolved to their kind up front so row generation is a
+// straight iteration without per-row map building. circularFKColumns marks
+// columns whose foreign keys point into a circular dependency; it is nil
+// for normal tables. The compiled plan is cached, so each table pays the
+// compilation cost once. Safe for concurrent use.
+func (dp *DatabasePopulator) compilePlan(table string, circularFKColumns map[string]bool) *tablePlan {
+	dp.mu.Lock()
+	defer dp.mu.Unlock()
+
+	if plan, ok := dp.plans[table]; ok {
+		return plan
+	}
+
+	columns := dp.SchemaAnalyzer.TableColumns[table]
+	if len(columns) == 0 {
+		return nil
+	}
+
+	// Build a foreign key index once
+	fkByColumn := make(map[string]models.ForeignKey)
+	for _, fk := range dp.SchemaAnalyzer.ForeignKeys[table] {
+		fkByColumn[fk.Column] = fk
+	}
+
+	plan := &tablePlan{Table: table}
+	var columnNames []string
+	var placeholders []string
+
+	for _, column := range columns {
+		// Skip auto-increment columns, but remember the column so its
+		// generated IDs can be recorded after each insert
+		if strings.Contains(strings.ToLower(column.Extra), "auto_increment") {
+			plan.AutoIncrementColumn = column.Name
+			continue
+		}
+
+		op := columnOp{Name: column.Name, Kind: opGenerate, Column: column}
+		if fk, isFk := fkByColumn[column.Name]; isFk {
+			op.ForeignKey = fk
+			if circularFKColumns[column.Name] {
+				op.Kind = opCircularForeignKey
+			} else {
+				op.Kind = opForeignKey
+			}
+		}
+
+		// Resolve the column's generator once; generated columns use it
+		// for every row, circular foreign keys only for the NOT NULL
+		// placeholder values of the first pass
+		if op.Kind != opForeignKey {
+			op.Generate = dp.DataGenerator.GeneratorFor(table, column)
+		}
+
+		plan.Ops = append(plan.Ops, op)
+		columnNames = append(columnNames, connector.QuoteIdentifier(column.Name))
+		placeholders = append(placeholders, "?")
 	}
+
+	if len(columnNames) > 0 {
+		// Prepare the INSERT statement prefix and per-row placeholder
+		// group so that batches can be combined into multi-row INSERT
+		// statements
+		plan.InsertPrefix = fmt.Sprintf(
+			"INSERT INTO %s (%s) VALUES",
+			connector.QuoteIdentifier(table),
+			strings.Join(columnNames, ", "),
+		)
+		plan.RowPlaceholders = "(" + strings.Join(placeholders, ", ") + ")"
+	}
+
+	dp.plans[table] = plan
+	return plan
 }
 
 // PopulateDatabase populates the database with fake data
@@ -50,17 +188,66 @@ func (dp *DatabasePopulator) PopulateDatabase() bool {
 	// Get table insertion order
 	orderedTables, circularTables := dp.SchemaAnalyzer.GetTableInsertionOrder()
 
-	// Track overall success
-	success := true
+	// Set up the foreign-key value pools before any table is populated
+	dp.initFKTracking()
 
-	// Populate tables in order
+	// Only announce the local-infile capability when a batch can actually
+	// reach the bulk-load threshold (many-to-many tables may get up to
+	// twice NumRecords); this must happen before tables are populated
+	// concurrently, as it may reopen the connection pool
+	if 2*dp.NumRecords >= bulkLoadThreshold {
+		if err := dp.DB.EnableLocalInfile(); err != nil {
+			dp.Logger.Warningf("Could not enable local-infile support, bulk loads disabled: %v", err)
+		}
+	}
+
+	// Group the independent tables into dependency levels; tables within
+	// a level have no foreign key dependencies on each other, so each
+	// level can be populated concurrently
+	levels := dp.SchemaAnalyzer.GetTableLevels()
+	leveled := make(map[string]bool)
+
+	for _, level := range levels {
+		for _, table := range level {
+			leveled[table] = true
+		}
+
+		if len(level) == 1 {
+			if !dp.populateTable(level[0]) {
+				dp.markTableFailed(level[0])
+			}
+			continue
+		}
+
+		// Bound the in-flight tables so a wide level cannot open one
+		// connection and transaction per table and exhaust the server's
+		// max_connections
+		sem := make(chan struct{}, maxConcurrentTables)
+		var wg sync.WaitGroup
+		for _, table := range level {
+			wg.Add(1)
+			sem <- struct{}{}
+			go func(table string) {
+				defer wg.Done()
+				defer func() { <-sem }()
+				if !dp.populateTable(table) {
+					dp.markTableFailed(table)
+				}
+			}(table)
+		}
+		wg.Wait()
+	}
+
+	// Populate the remaining tables (circular dependencies and
+	// many-to-many tables) sequentially in their insertion order
 	for _, table := range orderedTables {
-		tableSuccess := false
+		if leveled[table] {
+			continue
+		}
 
-		// Check if this table is part of a circular dependency
-		isCircular := circularTables[table]
+		tableSuccess := false
 
-		if isCircular {
+		if circularTables[table] {
 			// Handle circular dependency with special approach
 			tableSuccess = dp.populateCircularTable(table)
 		} else {
@@ -69,99 +256,374 @@ func (dp *DatabasePopulator) PopulateDatabase() bool {
 		}
 
 		if !tableSuccess {
-			dp.FailedTables[table] = true
-			success = false
+			dp.markTableFailed(table)
 		}
 	}
 
-	return success
+	// Retry failed tables now that more of their dependencies may have data
+	dp.handleFailedTables(circularTables)
+
+	return len(dp.FailedTables) == 0
 }
 
-// populateTable populates a single table with fake data
-func (dp *DatabasePopulator) populateTable(table string) bool {
-	dp.Logger.Infof("Populating table: %s", table)
+// handleFailedTables retries failed tables for up to MaxRetries passes.
+// Each pass only retries the tables whose foreign key dependencies are
+// satisfied (the referenced column's value pool has data, or the key is
+// nullable), in
+// sorted order, so retry effort follows the dependency order instead of
+// repeatedly attempting tables whose prerequisites are still missing.
+func (dp *DatabasePopulator) handleFailedTables(circularTables map[string]bool) {
+	for attempt := 1; attempt <= dp.MaxRetries && len(dp.FailedTables) > 0; attempt++ {
+		// Collect the failed tables that can make progress this pass
+		var ready []string
+		for table := range dp.FailedTables {
+			satisfied := true
+			for _, fk := range dp.SchemaAnalyzer.ForeignKeys[table] {
+				if fk.ReferencedTable == table || fk.IsNullable {
+					continue
+				}
+				// Generation draws from the FK value pools, so the
+				// referenced column must have actual values — a bare row
+				// count is not enough (a partial INSERT IGNORE retry
+				// bumps the count without feeding the pools)
+				if len(dp.fkValues[fk.ReferencedTable][fk.ReferencedColumn]) == 0 {
+					satisfied = false
+					break
+				}
+			}
+			if satisfied {
+				ready = append(ready, table)
+			}
+		}
 
-	// Get columns for this table
-	columns := dp.SchemaAnalyzer.TableColumns[table]
-	if len(columns) == 0 {
-		dp.Logger.Errorf("No columns found for table: %s", table)
+		if len(ready) == 0 {
+			dp.Logger.Warningf("No failed table has its dependencies satisfied, giving up after %d retry pass(es)", attempt-1)
+			return
+		}
+
+		sort.Strings(ready)
+		dp.Logger.Infof("Retry pass %d/%d for failed tables: %s", attempt, dp.MaxRetries, strings.Join(ready, ", "))
+
+		progress := false
+		for _, table := range ready {
+			var tableSuccess bool
+			if circularTables[table] {
+				tableSuccess = dp.populateCircularTable(table)
+			} else {
+				tableSuccess = dp.populateTable(table)
+				if !tableSuccess && dp.tryPartialPopulation(table) {
+					// Even a partial batch is enough to unblock tables
+					// that depend on this one
+					tableSuccess = true
+				}
+			}
+
+			if tableSuccess {
+				delete(dp.FailedTables, table)
+				progress = true
+			}
+		}
+
+		// If a full pass made no progress, further passes won't either
+		if !progress {
+			return
+		}
+	}
+}
+
+// partialRetryRows is the number of candidate rows generated for a
+// failed table's partial-population attempt
+const partialRetryRows = 10
+
+// tryPartialPopulation makes a lightweight attempt at a failed table: it
+// generates a handful of candidate rows and inserts them all with a
+// single INSERT IGNORE, letting MySQL discard the rows that violate
+// constraints instead of probing row by row. The attempt succeeds when
+// at least one row lands.
+func (dp *DatabasePopulator) tryPartialPopulation(table string) bool {
+	plan := dp.compilePlan(table, nil)
+	if plan == nil || len(plan.Ops) == 0 {
 		return false
 	}
 
-	// Check if this is a many-to-many table
-	isManyToMany := dp.SchemaAnalyzer.ManyToManyTables[table]
+	dp.mu.Lock()
+	fkPools := dp.buildFKValuePools(plan)
 
-	// Get foreign keys for this table
-	foreignKeys := dp.SchemaAnalyzer.ForeignKeys[table]
+	paramsList := make([][]interface{}, 0, partialRetryRows)
+	insertedRecords := make([]map[string]interface{}, 0, partialRetryRows)
+	for i := 0; i < partialRetryRows; i++ {
+		record, params := dp.generateRecordFromPlan(plan, fkPools)
+		if params != nil {
+			paramsList = append(paramsList, params)
+			insertedRecords = append(insertedRecords, record)
+		}
+	}
+	dp.mu.Unlock()
 
-	// Prepare column names and placeholders for the INSERT statement
-	var columnNames []string
-	var placeholders []string
-	var columnObjects []models.Column
+	if len(paramsList) == 0 {
+		return false
+	}
 
-	for _, column := range columns {
-		// Skip auto-increment columns
-		if strings.Contains(strings.ToLower(column.Extra), "auto_increment") {
-			continue
+	// Combine the candidate rows into one multi-row INSERT IGNORE so the
+	// whole attempt costs a single round trip; going through
+	// ExecuteBatchInsert also reports the first auto-increment ID, so the
+	// landed rows can feed the FK value pools of dependent tables
+	ignorePrefix := strings.Replace(plan.InsertPrefix, "INSERT INTO", "INSERT IGNORE INTO", 1)
+	affected, firstInsertID, failedRows, err := dp.DB.ExecuteBatchInsert(ignorePrefix, plan.RowPlaceholders, paramsList)
+	if err != nil || affected == 0 {
+		return false
+	}
+
+	dp.Logger.Infof("Partially populated table %s with %d of %d candidate rows",
+		table, affected, len(paramsList))
+
+	// IGNORE reports how many rows landed, not which ones, so the full
+	// bookkeeping (including back-filled auto-increment IDs) only applies
+	// when every candidate row landed
+	if len(failedRows) == 0 && int(affected) == len(insertedRecords) {
+		dp.recordInsertedData(plan, insertedRecords, firstInsertID)
+	} else {
+		dp.mu.Lock()
+		dp.insertedCounts[plan.Table] += int(affected)
+		dp.mu.Unlock()
+	}
+
+	return true
+}
+
+// initFKTracking computes which (table, column) pairs are referenced by
+// foreign keys and which tables must retain their full records (only the
+// circular tables, whose records drive the second-pass UPDATE), and
+// resets the column-oriented FK value pools
+func (dp *DatabasePopulator) initFKTracking() {
+	dp.referencedCols = make(map[string]map[string]bool)
+	for _, fks := range dp.SchemaAnalyzer.ForeignKeys {
+		for _, fk := range fks {
+			cols, ok := dp.referencedCols[fk.ReferencedTable]
+			if !ok {
+				cols = make(map[string]bool)
+				dp.referencedCols[fk.ReferencedTable] = cols
+			}
+			cols[fk.ReferencedColumn] = true
 		}
+	}
 
-		columnNames = append(columnNames, column.Name)
-		placeholders = append(placeholders, "?")
-		columnObjects = append(columnObjects, column)
+	dp.fkValues = make(map[string]map[string][]interface{})
+	dp.insertedCounts = make(map[string]int)
+	dp.circularTables = dp.SchemaAnalyzer.GetCircularTables()
+	dp.retainRecords = dp.circularTables
+}
+
+// markTableFailed records a table as failed; safe for concurrent use
+func (dp *DatabasePopulator) markTableFailed(table string) {
+	dp.mu.Lock()
+	dp.FailedTables[table] = true
+	dp.mu.Unlock()
+}
+
+// populateTable populates a single table with fake data
+func (dp *DatabasePopulator) populateTable(table string) bool {
+	dp.Logger.Infof("Populating table: %s", table)
+
+	// Compile the per-table plan (cached after the first call)
+	plan := dp.compilePlan(table, nil)
+	if plan == nil {
+		dp.Logger.Errorf("No columns found for table: %s", table)
+		return false
 	}
 
-	if len(columnNames) == 0 {
+	if len(plan.Ops) == 0 {
 		dp.Logger.Warningf("No insertable columns found for table: %s", table)
 		return true // Consider this a success since there's nothing to insert
 	}
 
-	// Prepare the INSERT statement
-	insertSQL := fmt.Sprintf(
-		"INSERT INTO %s (%s) VALUES (%s)",
-		table,
-		strings.Join(columnNames, ", "),
-		strings.Join(placeholders, ", "),
-	)
-
 	// Determine how many records to insert
 	numRecords := dp.NumRecords
-	if isManyToMany {
+	if dp.SchemaAnalyzer.ManyToManyTables[table] {
 		// For many-to-many tables, calculate based on related tables
-		numRecords = dp.calculateManyToManyRecords(table, foreignKeys)
+		numRecords = dp.calculateManyToManyRecords(table, dp.SchemaAnalyzer.ForeignKeys[table])
 	}
 
-	// Generate and insert data
-	var paramsList [][]interface{}
-	var insertedRecords []map[string]interface{}
+	// Generate all records first, then insert them in a single transaction
+	// so the table commits (and fsyncs) once instead of once per batch.
+	// Generation holds the populator lock (the data generator and rand
+	// source are not safe for concurrent use); the insert itself runs
+	// unlocked so concurrent tables overlap their I/O.
+	paramsList := make([][]interface{}, 0, numRecords)
+	insertedRecords := make([]map[string]interface{}, 0, numRecords)
+
+	dp.mu.Lock()
+	fkPools := dp.buildFKValuePools(plan)
 
 	for i := 0; i < numRecords; i++ {
 		// Generate a record
-		record, params := dp.generateRecord(table, columnNames, columnObjects, foreignKeys)
-		
+		record, params := dp.generateRecordFromPlan(plan, fkPools)
+
 		if params != nil {
 			paramsList = append(paramsList, params)
 			insertedRecords = append(insertedRecords, record)
 		}
+	}
+	dp.mu.Unlock()
+
+	// Very large batches go through LOAD DATA LOCAL INFILE, which skips
+	// the server's SQL parser; if the server refuses (local_infile is
+	// disabled), fall back to batched INSERT statements
+	if dp.shouldBulkLoad(plan, len(paramsList)) {
+		if dp.bulkLoadRecords(plan, paramsList, insertedRecords) {
+			dp.Logger.Infof("Successfully populated table %s with %d records", table, numRecords)
+			return true
+		}
+		dp.Logger.Warningf("Bulk load failed for table %s, falling back to batched INSERT", table)
+	}
 
-		// Insert in batches of 100 records
-		if len(paramsList) >= 100 || (i == numRecords-1 && len(paramsList) > 0) {
-			_, err := dp.DB.ExecuteMany(insertSQL, paramsList)
-			if err != nil {
-				dp.Logger.Errorf("Error inserting data into table %s: %v", table, err)
-				return false
+	inserted, ok := dp.insertRecords(plan, paramsList, insertedRecords)
+	if !ok {
+		return false
+	}
+
+	// Ending up with no rows is a failure even when nothing errored:
+	// generation yields nothing while a NOT NULL foreign key has no
+	// values to draw, and a many-to-many table is sized to zero while a
+	// referenced table is empty. Reporting failure is what lets the
+	// dependency-aware retry passes revisit this table once its
+	// dependencies have data.
+	if inserted == 0 && dp.NumRecords > 0 {
+		dp.Logger.Warningf("No rows were inserted into table %s", table)
+		return false
+	}
+
+	if inserted < numRecords {
+		dp.Logger.Infof("Populated table %s with %d of %d records", table, inserted, numRecords)
+	} else {
+		dp.Logger.Infof("Successfully populated table %s with %d records", table, inserted)
+	}
+	return true
+}
+
+// bulkLoadThreshold is the record count above which a table is loaded
+// via LOAD DATA LOCAL INFILE instead of multi-row INSERT statements
+const bulkLoadThreshold = 1000
+
+// shouldBulkLoad reports whether a table's batch should go through LOAD
+// DATA LOCAL INFILE. LOAD DATA does not report the generated
+// auto-increment IDs, so tables whose generated IDs feed foreign keys
+// (or the circular second-pass UPDATE) must use the INSERT path.
+func (dp *DatabasePopulator) shouldBulkLoad(plan *tablePlan, numRecords int) bool {
+	if numRecords < bulkLoadThreshold || !dp.DB.LocalInfileEnabled() {
+		return false
+	}
+	if plan.AutoIncrementColumn != "" &&
+		(len(dp.referencedCols[plan.Table]) > 0 || dp.retainRecords[plan.Table]) {
+		return false
+	}
+	return true
+}
+
+// bulkLoadRecords loads the generated records for a table via LOAD DATA
+// LOCAL INFILE and, on success, records the inserted values as the
+// INSERT path would
+func (dp *DatabasePopulator) bulkLoadRecords(plan *tablePlan, paramsList [][]interface{}, insertedRecords []map[string]interface{}) bool {
+	columnNames := make([]string, len(plan.Ops))
+	for i, op := range plan.Ops {
+		columnNames[i] = op.Name
+	}
+
+	affected, err := dp.DB.ExecuteLoadData(plan.Table, columnNames, paramsList)
+	if err != nil {
+		return false
+	}
+
+	dp.Logger.Infof("Bulk loaded %d rows into table %s", affected, plan.Table)
+	dp.recordInsertedData(plan, insertedRecords, 0)
+	return true
+}
+
+// insertRecords inserts the generated records for a table in a single
+// transaction and, on success, records them (with any generated
+// auto-increment IDs back-filled) in InsertedData. It returns the number
+// of rows that actually landed; a batch whose rows were all rejected
+// counts as a failure so the table stays eligible for retry.
+func (dp *DatabasePopulator) insertRecords(plan *tablePlan, paramsList [][]interface{}, insertedRecords []map[string]interface{}) (int, bool) {
+	if len(paramsList) == 0 {
+		return 0, true
+	}
+
+	_, firstInsertID, failedRows, err := dp.DB.ExecuteBatchInsert(plan.InsertPrefix, plan.RowPlaceholders, paramsList)
+	if err != nil {
+		// The transaction was rolled back, so no records were inserted
+		dp.Logger.Errorf("Error inserting data into table %s: %v", plan.Table, err)
+		return 0, false
+	}
+
+	if len(failedRows) == len(paramsList) {
+		dp.Logger.Errorf("All %d rows for table %s were rejected during insert", len(paramsList), plan.Table)
+		return 0, false
+	}
+
+	// Drop records whose rows were rejected so InsertedData only holds
+	// rows that actually exist in the database
+	if len(failedRows) > 0 {
+		dp.Logger.Warningf("Dropped %d of %d rows for table %s during insert",
+			len(failedRows), len(paramsList), plan.Table)
+
+		failedSet := make(map[int]bool, len(failedRows))
+		for _, idx := range failedRows {
+			failedSet[idx] = true
+		}
+
+		kept := make([]map[string]interface{}, 0, len(insertedRecords)-len(failedRows))
+		for i, record := range insertedRecords {
+			if !failedSet[i] {
+				kept = append(kept, record)
 			}
+		}
+		insertedRecords = kept
+	}
 
-			// Store inserted data for reference
-			dp.InsertedData[table] = append(dp.InsertedData[table], insertedRecords...)
+	dp.recordInsertedData(plan, insertedRecords, firstInsertID)
+	return len(insertedRecords), true
+}
 
-			// Reset for next batch
-			paramsList = nil
-			insertedRecords = nil
+// recordInsertedData records a table's inserted values: generated
+// auto-increment IDs are back-filled (MySQL assigns contiguous IDs to
+// the rows of a multi-row INSERT), the referenced columns feed the FK
+// value pools, and only circular tables keep their full records (for the
+// second-pass UPDATE)
+func (dp *DatabasePopulator) recordInsertedData(plan *tablePlan, insertedRecords []map[string]interface{}, firstInsertID int64) {
+	if plan.AutoIncrementColumn != "" && firstInsertID > 0 {
+		for i, record := range insertedRecords {
+			record[plan.AutoIncrementColumn] = firstInsertID + int64(i)
 		}
 	}
 
-	dp.Logger.Infof("Successfully populated table %s with %d records", table, numRecords)
-	return true
+	dp.mu.Lock()
+	if dp.fkValues == nil {
+		dp.initFKTracking()
+	}
+
+	dp.insertedCounts[plan.Table] += len(insertedRecords)
+
+	if cols := dp.referencedCols[plan.Table]; len(cols) > 0 {
+		pools, ok := dp.fkValues[plan.Table]
+		if !ok {
+			pools = make(map[string][]interface{})
+			dp.fkValues[plan.Table] = pools
+		}
+
+		for col := range cols {
+			for _, record := range insertedRecords {
+				if value := record[col]; value != nil {
+					pools[col] = append(pools[col], value)
+				}
+			}
+		}
+	}
+
+	if dp.retainRecords[plan.Table] {
+		dp.InsertedData[plan.Table] = append(dp.InsertedData[plan.Table], insertedRecords...)
+	}
+	dp.mu.Unlock()
 }
 
 // populateCircularTable populates a table involved in circular dependencies
@@ -178,115 +640,92 @@ func (dp *DatabasePopulator) populateCircularTable(table string) bool {
 	// Get foreign keys for this table
 	foreignKeys := dp.SchemaAnalyzer.ForeignKeys[table]
 
-	// Identify circular foreign keys
-	var circularFKs []models.ForeignKey
-	var nonCircularFKs []models.ForeignKey
-	circularTables, _ := dp.SchemaAnalyzer.GetTableInsertionOrder()
-	circularTablesMap := make(map[string]bool)
-	for _, t := range circularTables {
-		circularTablesMap[t] = true
+	// Identify circular foreign keys using the cached circular set
+	if dp.circularTables == nil {
+		dp.circularTables = dp.SchemaAnalyzer.GetCircularTables()
 	}
 
+	var circularFKs []models.ForeignKey
+	circularFKColumns := make(map[string]bool)
 	for _, fk := range foreignKeys {
-		if circularTablesMap[fk.ReferencedTable] {
+		if dp.circularTables[fk.ReferencedTable] {
 			circularFKs = append(circularFKs, fk)
-		} else {
-			nonCircularFKs = append(nonCircularFKs, fk)
+			circularFKColumns[fk.Column] = true
 		}
 	}
 
-	// Prepare column names and placeholders for the INSERT statement
-	var columnNames []string
-	var placeholders []string
-	var columnObjects []models.Column
-
-	for _, column := range columns {
-		// Skip auto-increment columns
-		if strings.Contains(strings.ToLower(column.Extra), "auto_increment") {
-			continue
-		}
-
-		columnNames = append(columnNames, column.Name)
-		placeholders = append(placeholders, "?")
-		columnObjects = append(columnObjects, column)
-	}
-
-	if len(columnNames) == 0 {
+	// Compile the per-table plan (cached after the first call)
+	plan := dp.compilePlan(table, circularFKColumns)
+	if len(plan.Ops) == 0 {
 		dp.Logger.Warningf("No insertable columns found for table: %s", table)
 		return true // Consider this a success since there's nothing to insert
 	}
 
-	// Prepare the INSERT statement
-	insertSQL := fmt.Sprintf(
-		"INSERT INTO %s (%s) VALUES (%s)",
-		table,
-		strings.Join(columnNames, ", "),
-		strings.Join(placeholders, ", "),
-	)
-
 	// First pass: Insert records with NULL for circular foreign keys
+	// All records are generated first and inserted in a single transaction
 	dp.Logger.Infof("First pass: Inserting records with NULL for circular foreign keys")
-	var paramsList [][]interface{}
-	var insertedRecords []map[string]interface{}
+	paramsList := make([][]interface{}, 0, dp.NumRecords)
+	insertedRecords := make([]map[string]interface{}, 0, dp.NumRecords)
+	fkPools := dp.buildFKValuePools(plan)
 
 	for i := 0; i < dp.NumRecords; i++ {
 		// Generate a record with NULL for circular foreign keys
-		record, params := dp.generateRecordWithNullCircularFKs(table, columnNames, columnObjects, nonCircularFKs, circularFKs)
-		
+		record, params := dp.generateRecordFromPlan(plan, fkPools)
+
 		if params != nil {
 			paramsList = append(paramsList, params)
 			insertedRecords = append(insertedRecords, record)
 		}
+	}
 
-		// Insert in batches of 100 records
-		if len(paramsList) >= 100 || (i == dp.NumRecords-1 && len(paramsList) > 0) {
-			_, err := dp.DB.ExecuteMany(insertSQL, paramsList)
-			if err != nil {
-				dp.Logger.Errorf("Error inserting data into table %s (first pass): %v", table, err)
-				return false
-			}
-
-			// Store inserted data for reference
-			dp.InsertedData[table] = append(dp.InsertedData[table], insertedRecords...)
+	inserted, ok := dp.insertRecords(plan, paramsList, insertedRecords)
+	if !ok {
+		return false
+	}
 
-			// Reset for next batch
-			paramsList = nil
-			insertedRecords = nil
-		}
+	// As in populateTable, zero generated rows means a dependency had no
+	// data yet; fail so the retry passes come back to this table
+	if inserted == 0 && dp.NumRecords > 0 {
+		dp.Logger.Warningf("No rows were inserted into table %s", table)
+		return false
 	}
 
 	// Second pass: Update records with valid foreign keys
 	dp.Logger.Infof("Second pass: Updating records with valid circular foreign keys")
+
+	// Get primary key column for this table
+	var pkColumn string
+	for _, col := range columns {
+		if col.ColumnKey == "PRI" {
+			pkColumn = col.Name
+			break
+		}
+	}
+
 	for _, fk := range circularFKs {
 		// Skip if the referenced table has no data
-		if len(dp.InsertedData[fk.ReferencedTable]) == 0 {
+		referencedRecords := dp.InsertedData[fk.ReferencedTable]
+		if len(referencedRecords) == 0 {
 			dp.Logger.Warningf("Referenced table %s has no data, skipping update for %s.%s",
 				fk.ReferencedTable, table, fk.Column)
 			continue
 		}
 
-		// Get primary key column for this table
-		var pkColumn string
-		for _, col := range columns {
-			if col.ColumnKey == "PRI" {
-				pkColumn = col.Name
-				break
-			}
-		}
-
 		if pkColumn == "" {
 			dp.Logger.Warningf("No primary key found for table %s, skipping update", table)
 			continue
 		}
 
+		// Build the UPDATE statement once for this foreign key
+		updateSQL := fmt.Sprintf(
+			"UPDATE %s SET %s = ? WHERE %s = ?",
+			connector.QuoteIdentifier(table),
+			connector.QuoteIdentifier(fk.Column),
+			connector.QuoteIdentifier(pkColumn),
+		)
+
 		// Update each record with a random value from the referenced table
 		for _, record := range dp.InsertedData[table] {
-			// Get a random record from the referenced table
-			referencedRecords := dp.InsertedData[fk.ReferencedTable]
-			if len(referencedRecords) == 0 {
-				continue
-			}
-
 			// Get the primary key value for this record
 			pkValue := record[pkColumn]
 			if pkValue == nil {
@@ -294,21 +733,15 @@ func (dp *DatabasePopulator) populateCircularTable(table string) bool {
 			}
 
 			// Get a random referenced value
-			referencedRecord := referencedRecords[time.Now().Nanosecond()%len(referencedRecords)]
+			referencedRecord := referencedRecords[dp.rng.Intn(len(referencedRecords))]
 			referencedValue := referencedRecord[fk.ReferencedColumn]
 			if referencedValue == nil {
 				continue
 			}
 
-			// Update the record
-			updateSQL := fmt.Sprintf(
-				"UPDATE %s SET %s = ? WHERE %s = ?",
-				table,
-				fk.Column,
-				pkColumn,
-			)
-
-			_, err := dp.DB.ExecuteStatement(updateSQL, referencedValue, pkValue)
+			// The same UPDATE runs once per record, so go through the
+			// connector's prepared-statement cache
+			_, err := dp.DB.ExecutePreparedStatement(updateSQL, referencedValue, pkValue)
 			if err != nil {
 				dp.Logger.Errorf("Error updating circular foreign key %s.%s: %v", table, fk.Column, err)
 				// Continue with other records
@@ -316,130 +749,80 @@ func (dp *DatabasePopulator) populateCircularTable(table string) bool {
 		}
 	}
 
-	dp.Logger.Infof("Successfully populated circular dependency table %s with %d records", table, dp.NumRecords)
+	if inserted < dp.NumRecords {
+		dp.Logger.Infof("Populated circular dependency table %s with %d of %d records", table, inserted, dp.NumRecords)
+	} else {
+		dp.Logger.Infof("Successfully populated circular dependency table %s with %d records", table, inserted)
+	}
 	return true
 }
 
-// generateRecord generates a single record for a table
-func (dp *DatabasePopulator) generateRecord(
-	table string,
-	columnNames []string,
-	columns []models.Column,
-	foreignKeys []models.ForeignKey,
-) (map[string]interface{}, []interface{}) {
-	record := make(map[string]interface{})
-	var params []interface{}
-
-	// Create a map of foreign key columns for quick lookup
-	fkMap := make(map[string]models.ForeignKey)
-	for _, fk := range foreignKeys {
-		fkMap[fk.Column] = fk
+// buildFKValuePools resolves the column-oriented value pool for each
+// foreign-key op, indexed parallel to plan.Ops. The pools are maintained
+// incrementally as tables are inserted, so this is a map lookup per FK
+// column rather than a copy of the referenced table's records.
+func (dp *DatabasePopulator) buildFKValuePools(plan *tablePlan) [][]interface{} {
+	if dp.fkValues == nil {
+		dp.initFKTracking()
 	}
 
-	// Generate data for each column
-	for i, columnName := range columnNames {
-		column := columns[i]
-		var value interface{}
+	pools := make([][]interface{}, len(plan.Ops))
 
-		// Check if this is a foreign key
-		if fk, isFk := fkMap[columnName]; isFk {
-			// Get a random value from the referenced table
-			value = dp.getRandomForeignKeyValue(fk)
-			
-			// If no value is available and the column is NOT NULL, this is a problem
-			if value == nil && !column.IsNullable {
-				dp.Logger.Errorf("No value available for NOT NULL foreign key %s.%s referencing %s.%s",
-					table, columnName, fk.ReferencedTable, fk.ReferencedColumn)
-				return nil, nil
-			}
-		} else {
-			// Generate a value based on column type
-			value = dp.DataGenerator.GenerateData(table, column)
+	for i, op := range plan.Ops {
+		if op.Kind != opForeignKey {
+			continue
 		}
-
-		record[columnName] = value
-		params = append(params, value)
+		pools[i] = dp.fkValues[op.ForeignKey.ReferencedTable][op.ForeignKey.ReferencedColumn]
 	}
 
-	return record, params
+	return pools
 }
 
-// generateRecordWithNullCircularFKs generates a record with NULL values for circular foreign keys
-func (dp *DatabasePopulator) generateRecordWithNullCircularFKs(
-	table string,
-	columnNames []string,
-	columns []models.Column,
-	nonCircularFKs []models.ForeignKey,
-	circularFKs []models.ForeignKey,
-) (map[string]interface{}, []interface{}) {
-	record := make(map[string]interface{})
-	var params []interface{}
+// generateRecordFromPlan generates a single record by running the table's
+// compiled column ops in order. fkPools holds the snapshotted foreign-key
+// value pools built by buildFKValuePools.
+func (dp *DatabasePopulator) generateRecordFromPlan(plan *tablePlan, fkPools [][]interface{}) (map[string]interface{}, []interface{}) {
+	record := make(map[string]interface{}, len(plan.Ops))
+	params := make([]interface{}, 0, len(plan.Ops))
 
-	// Create maps for foreign key columns
-	nonCircularFKMap := make(map[string]models.ForeignKey)
-	for _, fk := range nonCircularFKs {
-		nonCircularFKMap[fk.Column] = fk
-	}
-
-	circularFKMap := make(map[string]models.ForeignKey)
-	for _, fk := range circularFKs {
-		circularFKMap[fk.Column] = fk
-	}
-
-	// Generate data for each column
-	for i, columnName := range columnNames {
-		column := columns[i]
+	for i, op := range plan.Ops {
 		var value interface{}
 
-		// Check if this is a non-circular foreign key
-		if fk, isFk := nonCircularFKMap[columnName]; isFk {
-			// Get a random value from the referenced table
-			value = dp.getRandomForeignKeyValue(fk)
-			
+		switch op.Kind {
+		case opForeignKey:
+			// Get a random value from the referenced table's pool
+			if pool := fkPools[i]; len(pool) > 0 {
+				value = pool[dp.rng.Intn(len(pool))]
+			}
+
 			// If no value is available and the column is NOT NULL, this is a problem
-			if value == nil && !column.IsNullable {
+			if value == nil && !op.Column.IsNullable {
 				dp.Logger.Errorf("No value available for NOT NULL foreign key %s.%s referencing %s.%s",
-					table, columnName, fk.ReferencedTable, fk.ReferencedColumn)
+					plan.Table, op.Name, op.ForeignKey.ReferencedTable, op.ForeignKey.ReferencedColumn)
 				return nil, nil
 			}
-		} else if _, isCircularFK := circularFKMap[columnName]; isCircularFK {
+		case opCircularForeignKey:
 			// Set circular foreign keys to NULL for now
-			if !column.IsNullable {
+			if !op.Column.IsNullable {
 				// If the column is NOT NULL, we need to handle it differently
 				// For the first pass, we'll use a temporary value that will be updated later
 				// This might violate constraints temporarily but will be fixed in the second pass
-				value = dp.DataGenerator.GenerateData(table, column)
+				value = op.Generate()
 			} else {
 				value = nil
 			}
-		} else {
-			// Generate a value based on column type
-			value = dp.DataGenerator.GenerateData(table, column)
+		default:
+			// Generate a value using the column's resolved generator
+			value = op.Generate()
 		}
 
-		record[columnName] = value
+		record[op.Name] = value
 		params = append(params, value)
 	}
 
 	return record, params
 }
 
-// getRandomForeignKeyValue gets a random value from a referenced table
-func (dp *DatabasePopulator) getRandomForeignKeyValue(fk models.ForeignKey) interface{} {
-	// Check if we have inserted data for the referenced table
-	referencedRecords, ok := dp.InsertedData[fk.ReferencedTable]
-	if !ok || len(referencedRecords) == 0 {
-		return nil
-	}
-
-	// Get a random record
-	randomIndex := time.Now().Nanosecond() % len(referencedRecords)
-	randomRecord := referencedRecords[randomIndex]
-
-	// Return the referenced column value
-	return randomRecord[fk.ReferencedColumn]
-}
-
 // calculateManyToManyRecords calculates how many records to insert for a many-to-many table
 func (dp *DatabasePopulator) calculateManyToManyRecords(table string, foreignKeys []models.ForeignKey) int {
 	// Get unique referenced tables
@@ -453,9 +836,8 @@ func (dp *DatabasePopulator) calculateManyToManyRecords(table string, foreignKey
 	var availableReferencedTables int = 0
 
 	for refTable := range referencedTables {
-		refRecords, ok := dp.InsertedData[refTable]
-		if ok && len(refRecords) > 0 {
-			totalPossibleCombinations *= len(refRecords)
+		if count := dp.insertedCounts[refTable]; count > 0 {
+			totalPossibleCombinations *= count
 			availableReferencedTables++
 		}
 	}
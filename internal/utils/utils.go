@@ -269,7 +269,7 @@ func VerifyTablePopulation(db *connector.DatabaseConnector, tables []string, min
 	partiallyPopulatedTables := make(map[string]int)
 
 	for _, table := range tables {
-		query := fmt.Sprintf("SELECT COUNT(*) as count FROM %s", table)
+		query := fmt.Sprintf("SELECT COUNT(*) as count FROM %s", connector.QuoteIdentifier(table))
 		result, err := db.ExecuteQuery(query)
 		if err != nil {
 			logger.Warningf("Could not verify record count for table: %s", table)